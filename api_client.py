@@ -4,10 +4,14 @@ Supports both live API access and mock data mode.
 """
 
 import logging
-from datetime import datetime, timedelta
-from typing import List, Optional
+from dataclasses import replace
+from datetime import datetime
+from functools import lru_cache
+from itertools import repeat
+from typing import ClassVar, Dict, List, Optional, Tuple
 
 import numpy as np
+import pandas as pd
 import requests
 
 from config import config
@@ -17,9 +21,139 @@ from models.station import Station
 logger = logging.getLogger(__name__)
 
 
+# Fixed historical window for mock data: 5 years, one reading per calendar day
+MOCK_START_DATE = datetime(2019, 1, 1)
+MOCK_END_DATE = datetime(2024, 1, 1)
+MOCK_TOTAL_DAYS = (MOCK_END_DATE - MOCK_START_DATE).days  # 1825 days
+
+# Shared daily date axis for all mock stations, built once at import
+_MOCK_DATE_INDEX = pd.date_range(MOCK_START_DATE, periods=MOCK_TOTAL_DAYS, freq="D")
+_MOCK_TIMESTAMPS = _MOCK_DATE_INDEX.to_pydatetime().tolist()
+_MOCK_TIMESTAMP_ARRAY = _MOCK_DATE_INDEX.to_numpy().astype("datetime64[s]")
+_MOCK_TIMESTAMP_ARRAY.setflags(write=False)
+
+# Days elapsed from start and the unit-amplitude annual cycle over them;
+# identical for every station, so computed once
+_MOCK_DAYS_ELAPSED = np.arange(MOCK_TOTAL_DAYS, dtype=np.float64)
+_MOCK_SEASONAL_UNIT = np.sin((_MOCK_DAYS_ELAPSED / 365.25) * 2 * np.pi)
+
+# Numerical regime parameters (no semantic labels)
+# Regime 0: Positive drift (depth increasing over time)
+# Regime 1: Negative drift (depth decreasing over time)
+# Regime 2: Near-zero drift (stable)
+MOCK_REGIME_PARAMS = (
+    {"baseline_depth": 10.0, "drift_per_day": 0.0015, "seasonal_amplitude": 0.03},  # Regime 0
+    {"baseline_depth": 12.0, "drift_per_day": -0.0015, "seasonal_amplitude": 0.03},  # Regime 1
+    {"baseline_depth": 11.5, "drift_per_day": 0.0001, "seasonal_amplitude": 0.0}   # Regime 2
+)
+
+# Deterministic seed base for mock noise
+MOCK_GLOBAL_SEED = 42
+
+
+def _mock_water_levels(
+    baseline_depth: float,
+    drift_per_day: float,
+    seasonal_amplitude: float,
+    rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Compute the daily mock water level depths (m) for one regime.
+    
+    Pure numeric kernel over the shared mock day axis; draws exactly
+    MOCK_TOTAL_DAYS noise samples from ``rng``.
+    """
+    # Accumulate all components into a single output buffer
+    # Trend component: linear drift over time, on top of the baseline
+    water_levels = np.multiply(_MOCK_DAYS_ELAPSED, drift_per_day)
+    water_levels += baseline_depth
+    
+    # Seasonal variation (sinusoidal, annual cycle)
+    water_levels += seasonal_amplitude * _MOCK_SEASONAL_UNIT
+    
+    # Bounded pseudo-noise (order of magnitude smaller than cumulative drift)
+    # Over 5 years, max cumulative drift is |0.0015 * 1825| = 2.74m
+    # Noise magnitude: ±0.005m (5mm) per day, much smaller than drift
+    water_levels += rng.uniform(-0.005, 0.005, size=MOCK_TOTAL_DAYS)
+    
+    # Ensure realistic bounds (5-20m below ground)
+    np.clip(water_levels, 5.0, 20.0, out=water_levels)
+    return np.round(water_levels, 3, out=water_levels)
+
+
+@lru_cache(maxsize=16)
+def _generate_mock_water_levels(station_index: int) -> np.ndarray:
+    """
+    Generate the deterministic daily mock water level series for a station.
+    
+    Uses index-based regime mapping to assign numerical drift parameters.
+    The returned array is cached and marked read-only.
+    """
+    regime = MOCK_REGIME_PARAMS[station_index % len(MOCK_REGIME_PARAMS)]
+    baseline_depth = regime["baseline_depth"]
+    drift_per_day = regime["drift_per_day"]
+    seasonal_amplitude = regime["seasonal_amplitude"]
+    
+    # Deterministic seed: global seed + station index
+    station_seed = MOCK_GLOBAL_SEED + station_index * 1000
+    rng = np.random.default_rng(station_seed)
+    
+    water_levels = _mock_water_levels(baseline_depth, drift_per_day, seasonal_amplitude, rng)
+    water_levels.setflags(write=False)
+    return water_levels
+
+
+def _generate_mock_readings(station_id: str, station_index: int) -> List[Reading]:
+    """
+    Generate the deterministic mock reading series for a station.
+    
+    The numeric series is cached; Reading objects are mutable, so fresh
+    ones are built on every call rather than shared between callers.
+    """
+    water_levels = _generate_mock_water_levels(station_index)
+    
+    # Generate one reading per calendar day; positional construction via
+    # map() avoids building keyword arguments for every reading
+    readings = list(map(
+        Reading,
+        repeat(station_id),
+        _MOCK_TIMESTAMPS,
+        water_levels.tolist(),
+        repeat("GOOD"),
+        repeat("MOCK")
+    ))
+    
+    return readings
+
+
 class NWDPClient:
     """Client for fetching groundwater data from NWDP API or mock sources."""
     
+    # Mock stations, built once; position in this list selects the mock regime
+    _MOCK_STATIONS: ClassVar[List[Station]] = [
+        Station(
+            station_id="DWLR-001",
+            name="Village Well Alpha",
+            state="Maharashtra",
+            district="Pune"
+        ),
+        Station(
+            station_id="DWLR-002",
+            name="Village Well Beta",
+            state="Maharashtra",
+            district="Nashik"
+        ),
+        Station(
+            station_id="DWLR-003",
+            name="Village Well Gamma",
+            state="Maharashtra",
+            district="Aurangabad"
+        )
+    ]
+    _MOCK_STATION_INDEX: ClassVar[Dict[str, int]] = {
+        station.station_id: index for index, station in enumerate(_MOCK_STATIONS)
+    }
+    
     def __init__(self, api_base_url: Optional[str] = None, api_key: Optional[str] = None):
         """
         Initialize NWDP client.
@@ -66,6 +200,66 @@ class NWDPClient:
         else:
             return self._fetch_api_readings(station_id, start_date, end_date)
     
+    def fetch_readings_frame(
+        self,
+        station_id: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> pd.DataFrame:
+        """
+        Fetch readings for a station as a columnar DataFrame.
+        
+        Same data as fetch_readings, laid out as one column per field
+        instead of one Reading object per day.
+        
+        Args:
+            station_id: Unique identifier for the station
+            start_date: Start date for data range (defaults to 1 year ago)
+            end_date: End date for data range (defaults to today)
+        
+        Returns:
+            DataFrame with station_id, timestamp and water_level_m columns
+        """
+        if config.is_mock_mode():
+            return self._fetch_mock_readings_frame(station_id)
+        
+        readings = self._fetch_api_readings(station_id, start_date, end_date)
+        return pd.DataFrame({
+            "station_id": station_id,
+            "timestamp": pd.to_datetime([r.timestamp for r in readings]),
+            "water_level_m": np.array([r.water_level_m for r in readings], dtype=np.float64)
+        })
+    
+    def fetch_readings_arrays(
+        self,
+        station_id: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Fetch readings for a station as parallel NumPy arrays.
+        
+        For callers that only need timestamps and levels (analytics,
+        charts); no Reading objects are built on the mock path.
+        
+        Args:
+            station_id: Unique identifier for the station
+            start_date: Start date for data range (defaults to 1 year ago)
+            end_date: End date for data range (defaults to today)
+        
+        Returns:
+            Tuple of (timestamps as datetime64[s], water levels as float64).
+            Mock arrays are shared and read-only.
+        """
+        if config.is_mock_mode():
+            station_index = self._mock_station_index(station_id)
+            return _MOCK_TIMESTAMP_ARRAY, _generate_mock_water_levels(station_index)
+        
+        readings = self._fetch_api_readings(station_id, start_date, end_date)
+        timestamps = np.array([r.timestamp for r in readings], dtype="datetime64[s]")
+        water_levels = np.array([r.water_level_m for r in readings], dtype=np.float64)
+        return timestamps, water_levels
+    
     def _fetch_api_stations(self) -> List[Station]:
         """Fetch stations from NWDP API."""
         # TODO: Implement API call
@@ -85,26 +279,8 @@ class NWDPClient:
     
     def _fetch_mock_stations(self) -> List[Station]:
         """Generate mock station data for development/testing."""
-        return [
-            Station(
-                station_id="DWLR-001",
-                name="Village Well Alpha",
-                state="Maharashtra",
-                district="Pune"
-            ),
-            Station(
-                station_id="DWLR-002",
-                name="Village Well Beta",
-                state="Maharashtra",
-                district="Nashik"
-            ),
-            Station(
-                station_id="DWLR-003",
-                name="Village Well Gamma",
-                state="Maharashtra",
-                district="Aurangabad"
-            )
-        ]
+        # Copies, so callers cannot alter the shared class-level stations
+        return [replace(station) for station in self._MOCK_STATIONS]
     
     def _fetch_mock_readings(
         self,
@@ -119,78 +295,22 @@ class NWDPClient:
         with one reading per calendar day. Uses index-based regime mapping
         to assign numerical drift parameters per station.
         """
-        # Fixed historical window: 5 years of data
-        FIXED_START_DATE = datetime(2019, 1, 1)
-        FIXED_END_DATE = datetime(2024, 1, 1)
-        TOTAL_DAYS = (FIXED_END_DATE - FIXED_START_DATE).days  # 1825 days
-        
-        # Get station index for deterministic regime mapping
-        stations = self._fetch_mock_stations()
-        station_ids = [s.station_id for s in stations]
-        try:
-            station_index = station_ids.index(station_id)
-        except ValueError:
+        station_index = self._mock_station_index(station_id)
+        return _generate_mock_readings(station_id, station_index)
+    
+    def _mock_station_index(self, station_id: str) -> int:
+        """Get station index for deterministic regime mapping."""
+        station_index = self._MOCK_STATION_INDEX.get(station_id)
+        if station_index is None:
             # Unknown station: use hash-based index for determinism
             station_index = hash(station_id) % 3
-        
-        # Numerical regime parameters (no semantic labels)
-        # Regime 0: Positive drift (depth increasing over time)
-        # Regime 1: Negative drift (depth decreasing over time)
-        # Regime 2: Near-zero drift (stable)
-        REGIME_INDEX = station_index % 3
-        
-        REGIME_PARAMS = [
-            {"baseline_depth": 10.0, "drift_per_day": 0.0015, "seasonal_amplitude": 0.03},  # Regime 0
-            {"baseline_depth": 12.0, "drift_per_day": -0.0015, "seasonal_amplitude": 0.03},  # Regime 1
-            {"baseline_depth": 11.5, "drift_per_day": 0.0001, "seasonal_amplitude": 0.0}   # Regime 2
-        ]
-        
-        regime = REGIME_PARAMS[REGIME_INDEX]
-        baseline_depth = regime["baseline_depth"]
-        drift_per_day = regime["drift_per_day"]
-        seasonal_amplitude = regime["seasonal_amplitude"]
-        
-        # Deterministic seed: global seed + station index
-        GLOBAL_SEED = 42
-        station_seed = GLOBAL_SEED + station_index * 1000
-        rng = np.random.RandomState(station_seed)
-        
-        # Generate one reading per calendar day
-        readings = []
-        current_date = FIXED_START_DATE
-        
-        for day_index in range(TOTAL_DAYS):
-            # Days elapsed from start
-            days_elapsed = day_index
-            
-            # Trend component: linear drift over time
-            trend_component = drift_per_day * days_elapsed
-            
-            # Seasonal variation (sinusoidal, annual cycle)
-            seasonal_phase = (days_elapsed / 365.25) * 2 * np.pi
-            seasonal_component = seasonal_amplitude * np.sin(seasonal_phase)
-            
-            # Bounded pseudo-noise (order of magnitude smaller than cumulative drift)
-            # Over 5 years, max cumulative drift is |0.0015 * 1825| = 2.74m
-            # Noise magnitude: ±0.005m (5mm) per day, much smaller than drift
-            noise = rng.uniform(-0.005, 0.005)
-            
-            # Calculate final water level depth
-            water_level = baseline_depth + trend_component + seasonal_component + noise
-            
-            # Ensure realistic bounds (5-20m below ground)
-            water_level = max(5.0, min(20.0, water_level))
-            
-            reading = Reading(
-                station_id=station_id,
-                timestamp=current_date,
-                water_level_m=round(water_level, 3),
-                quality_flag="GOOD",
-                source="MOCK"
-            )
-            readings.append(reading)
-            
-            current_date += timedelta(days=1)
-        
-        return readings
-
+        return station_index
+    
+    def _fetch_mock_readings_frame(self, station_id: str) -> pd.DataFrame:
+        """Generate the deterministic mock series as a columnar DataFrame."""
+        station_index = self._mock_station_index(station_id)
+        return pd.DataFrame({
+            "station_id": station_id,
+            "timestamp": _MOCK_DATE_INDEX,
+            "water_level_m": _generate_mock_water_levels(station_index)
+        })
@@ -4,6 +4,7 @@ Streamlit dashboard application for Groundwater Recharge Insight Dashboard.
 
 import logging
 from datetime import datetime, timedelta
+from typing import List
 
 import streamlit as st
 
@@ -27,13 +28,41 @@ st.set_page_config(
 )
 
 
+@st.cache_resource
+def get_data_store() -> DataStore:
+    """Shared DataStore, created once per server process."""
+    return DataStore()
+
+
+@st.cache_resource
+def get_api_client() -> NWDPClient:
+    """Shared NWDP client, created once per server process."""
+    return NWDPClient()
+
+
+@st.cache_data(ttl=3600)
+def fetch_source_stations(_api_client: NWDPClient) -> List[Station]:
+    """Station list from NWDP (or mock source), cached across reruns."""
+    return _api_client.fetch_stations()
+
+
+@st.cache_data(ttl=3600)
+def load_stations(_data_store: DataStore) -> List[Station]:
+    """
+    Stations stored in the database, cached across reruns.
+    
+    Must be cleared with load_stations.clear() after stations are saved.
+    """
+    return _data_store.get_all_stations()
+
+
 def initialize_components():
     """Initialize application components."""
     if "data_store" not in st.session_state:
-        st.session_state.data_store = DataStore()
+        st.session_state.data_store = get_data_store()
     
     if "api_client" not in st.session_state:
-        st.session_state.api_client = NWDPClient()
+        st.session_state.api_client = get_api_client()
     
     if "processing_engine" not in st.session_state:
         st.session_state.processing_engine = ProcessingEngine()
@@ -57,12 +86,15 @@ def main():
         
         if st.button("🔄 Refresh Data"):
             st.session_state.refresh_triggered = True
+            load_stations.clear()
+            st.session_state.data_store.invalidate_caches()
+            st.session_state.processing_engine.trend_engine.invalidate_cache()
     
     # Main content
     data_store = st.session_state.data_store
     
     # Get list of stations
-    stations = data_store.get_all_stations()
+    stations = load_stations(data_store)
     
     if not stations:
         st.warning("No stations found. Please fetch data from NWDP API or load mock data.")
@@ -73,7 +105,7 @@ def main():
                     data_store = st.session_state.data_store
                     
                     # Fetch mock stations
-                    mock_stations = api_client.fetch_stations()
+                    mock_stations = fetch_source_stations(api_client)
                     
                     if not mock_stations:
                         st.error("Failed to generate mock stations.")
@@ -84,14 +116,14 @@ def main():
                         
                         st.success(f"Loaded {len(mock_stations)} stations.")
                         
-                        # Generate and save readings for each station (only if not already present)
+                        # Generate readings for each station (only if not already present)
                         progress_bar = st.progress(0)
                         total_stations = len(mock_stations)
+                        all_readings = []
                         
                         for idx, station in enumerate(mock_stations):
-                            # Check if readings exist and count for this station
-                            existing_readings = data_store.get_readings(station.station_id)
-                            reading_count = len(existing_readings) if existing_readings else 0
+                            # Check how many readings exist for this station
+                            reading_count = data_store.count_readings(station.station_id)
                             
                             if reading_count < 365:
                                 # Generate readings (exactly 365 days)
@@ -105,7 +137,7 @@ def main():
                                 )
                                 
                                 if readings:
-                                    data_store.save_readings(readings)
+                                    all_readings.extend(readings)
                                     st.info(f"✅ Generated {len(readings)} readings for {station.name} (had {reading_count} readings)")
                                 else:
                                     st.warning(f"⚠️  No readings generated for {station.name}")
@@ -114,7 +146,12 @@ def main():
                             
                             progress_bar.progress((idx + 1) / total_stations)
                         
+                        # Save readings for all stations in a single transaction
+                        if all_readings:
+                            data_store.save_readings(all_readings)
+                        
                         st.success("✅ Sample data loading complete! Refresh the page to see stations.")
+                        load_stations.clear()
                         st.rerun()  # Refresh the app to show new stations
                         
                 except Exception as e:
@@ -186,16 +223,22 @@ def display_station_details(station: Station, data_store: DataStore, reference_d
     # Convert date to datetime for query (end of day to include all readings on that date)
     end_datetime = datetime.combine(end_date, datetime.max.time())
     start_datetime = datetime.combine(start_date, datetime.min.time())
-    readings = data_store.get_readings(station.station_id, start_datetime, end_datetime)
+    timestamps, levels = data_store.get_readings_arrays(station.station_id, start_datetime, end_datetime)
     
-    if not readings:
+    if timestamps.size == 0:
         st.warning(f"No readings found for station {station.station_id}")
         return
     
     # Calculate metrics using reference_date as calculation_date
     processing_engine = st.session_state.processing_engine
     calculation_datetime = datetime.combine(reference_date, datetime.min.time())
-    metrics = processing_engine.calculate_metrics(readings, calculation_date=calculation_datetime)
+    metrics = processing_engine.calculate_metrics_arrays(
+        station.station_id,
+        timestamps,
+        levels,
+        calculation_date=calculation_datetime,
+        data_store=data_store
+    )
     
     # Display metrics
     col1, col2 = st.columns(2)
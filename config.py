@@ -3,13 +3,13 @@ Configuration settings and mode toggles for the Groundwater Recharge Insight Das
 """
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
-    """Application configuration settings."""
+    """Application configuration settings (read-only after import)."""
     
     # Data source mode: 'api' or 'mock'
     data_mode: str = os.getenv("DATA_MODE", "mock")
@@ -37,13 +37,22 @@ class Config:
     # Mock data settings
     mock_data_path: Optional[str] = os.getenv("MOCK_DATA_PATH", None)
     
+    # Mode flags, resolved once from data_mode
+    _mock_mode: bool = field(init=False, repr=False, compare=False)
+    _api_mode: bool = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        mode = self.data_mode.lower()
+        object.__setattr__(self, "_mock_mode", mode == "mock")
+        object.__setattr__(self, "_api_mode", mode == "api")
+    
     def is_mock_mode(self) -> bool:
         """Check if running in mock data mode."""
-        return self.data_mode.lower() == "mock"
+        return self._mock_mode
     
     def is_api_mode(self) -> bool:
         """Check if running in API mode."""
-        return self.data_mode.lower() == "api"
+        return self._api_mode
 
 
 # Global configuration instance
@@ -3,18 +3,204 @@ SQLite database storage and retrieval helpers for groundwater data.
 """
 
 import logging
+import queue
 import sqlite3
+import threading
 from contextlib import contextmanager
-from datetime import date, datetime
-from typing import List, Optional
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
 
 from config import config
-from models.metrics import Metrics
+from models.metrics import Metrics, RiskLevel, TrendIndicator
 from models.reading import Reading
 from models.station import Station
 
 logger = logging.getLogger(__name__)
 
+# Per-connection SQLite tuning: fewer fsyncs, wait on locks instead of
+# failing, larger page cache (64 MB), temp tables in memory
+_CONNECTION_PRAGMAS = """
+    PRAGMA synchronous=NORMAL;
+    PRAGMA busy_timeout=30000;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-65536;
+    PRAGMA mmap_size=268435456;
+"""
+
+# Idle connections kept open per DataStore; when all are checked out a
+# caller opens an overflow connection, closed again on release
+_CONNECTION_POOL_SIZE = 4
+
+# Reading timestamps are stored as INTEGER seconds since the Unix epoch;
+# naive datetimes are taken as UTC wall time (no local-time shifting).
+# Sub-second precision is dropped: two readings for a station within the
+# same second share a key, and the later one is ignored on insert.
+_EPOCH = datetime(1970, 1, 1)
+_ONE_SECOND = timedelta(seconds=1)
+
+# Schema version recorded in PRAGMA user_version
+_SCHEMA_VERSION = 2
+
+# Maximum cached get_windows_edges results per DataStore (oldest evicted first)
+_WINDOWS_EDGES_CACHE_SIZE = 256
+
+# Metrics enums are stored as small INTEGER codes; labels live only in Python
+_TREND_CODES = {
+    TrendIndicator.RECHARGING: 1,
+    TrendIndicator.STABLE: 2,
+    TrendIndicator.DEPLETING: 3,
+    TrendIndicator.INSUFFICIENT_DATA: 4,
+}
+_TREND_BY_CODE = {code: trend for trend, code in _TREND_CODES.items()}
+
+_RISK_CODES = {
+    RiskLevel.LOW: 1,
+    RiskLevel.MODERATE: 2,
+    RiskLevel.HIGH: 3,
+    RiskLevel.CRITICAL: 4,
+}
+_RISK_BY_CODE = {code: risk for risk, code in _RISK_CODES.items()}
+
+
+def _naive_utc(value: datetime) -> datetime:
+    """Drop tzinfo, converting aware datetimes to UTC first."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _to_epoch_seconds(value: datetime) -> int:
+    """Convert a datetime to epoch seconds, rounding down."""
+    return (_naive_utc(value) - _EPOCH) // _ONE_SECOND
+
+
+def _to_epoch_seconds_ceil(value: datetime) -> int:
+    """Convert a datetime to epoch seconds, rounding up (for lower bounds)."""
+    return -((_EPOCH - _naive_utc(value)) // _ONE_SECOND)
+
+
+def _from_epoch_seconds(seconds: int) -> datetime:
+    """Convert stored epoch seconds back to a naive datetime."""
+    return _EPOCH + timedelta(seconds=seconds)
+
+
+# Statement texts are module constants so every call issues byte-identical
+# SQL and hits sqlite3's prepared-statement cache
+_SAVE_STATION_SQL = """
+    INSERT INTO stations 
+    (station_id, name, latitude, longitude, district, state, elevation_m, description, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(station_id) DO UPDATE SET
+        name = excluded.name,
+        latitude = excluded.latitude,
+        longitude = excluded.longitude,
+        district = excluded.district,
+        state = excluded.state,
+        elevation_m = excluded.elevation_m,
+        description = excluded.description,
+        updated_at = excluded.updated_at
+"""
+
+_SAVE_READING_SQL = """
+    INSERT OR IGNORE INTO readings 
+    (station_id, timestamp, water_level_m, quality_flag, source)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+_SAVE_METRICS_SQL = """
+    INSERT INTO metrics 
+    (station_id, calculation_date, trend_indicator, trend_magnitude, 
+     trend_period_days, seasonal_deviation, seasonal_baseline, 
+     risk_index, risk_level, data_points_used, calculation_notes)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(station_id, calculation_date) DO UPDATE SET
+        trend_indicator = excluded.trend_indicator,
+        trend_magnitude = excluded.trend_magnitude,
+        trend_period_days = excluded.trend_period_days,
+        seasonal_deviation = excluded.seasonal_deviation,
+        seasonal_baseline = excluded.seasonal_baseline,
+        risk_index = excluded.risk_index,
+        risk_level = excluded.risk_level,
+        data_points_used = excluded.data_points_used,
+        calculation_notes = excluded.calculation_notes
+"""
+
+_SELECT_LATEST_METRICS_SQL = """
+    SELECT * FROM metrics WHERE station_id = ?
+    ORDER BY calculation_date DESC LIMIT 1
+"""
+
+_SELECT_STATION_SQL = "SELECT * FROM stations WHERE station_id = ?"
+
+_SELECT_ALL_STATIONS_SQL = "SELECT * FROM stations ORDER BY name"
+
+# Readings range query, keyed by (start_date given, end_date given)
+_SELECT_READINGS_SQL = {
+    (False, False): "SELECT * FROM readings WHERE station_id = ? ORDER BY timestamp",
+    (True, False): "SELECT * FROM readings WHERE station_id = ? AND timestamp >= ? ORDER BY timestamp",
+    (False, True): "SELECT * FROM readings WHERE station_id = ? AND timestamp <= ? ORDER BY timestamp",
+    (True, True): (
+        "SELECT * FROM readings WHERE station_id = ? AND timestamp >= ? AND timestamp <= ? "
+        "ORDER BY timestamp"
+    ),
+}
+
+# Rows fetched per cursor step when streaming readings
+_READINGS_FETCH_SIZE = 512
+
+# Timestamp/level columns only, keyed like _SELECT_READINGS_SQL
+_SELECT_READING_ARRAYS_SQL = {
+    (False, False): "SELECT timestamp, water_level_m FROM readings WHERE station_id = ? ORDER BY timestamp",
+    (True, False): (
+        "SELECT timestamp, water_level_m FROM readings WHERE station_id = ? AND timestamp >= ? "
+        "ORDER BY timestamp"
+    ),
+    (False, True): (
+        "SELECT timestamp, water_level_m FROM readings WHERE station_id = ? AND timestamp <= ? "
+        "ORDER BY timestamp"
+    ),
+    (True, True): (
+        "SELECT timestamp, water_level_m FROM readings WHERE station_id = ? AND timestamp >= ? "
+        "AND timestamp <= ? ORDER BY timestamp"
+    ),
+}
+
+# Row layout used to load (timestamp, water_level_m) rows into NumPy
+_READING_ARRAY_DTYPE = np.dtype([("timestamp", np.int64), ("water_level_m", np.float64)])
+
+# First level, last level and count for each of N inclusive windows in one
+# statement; formatted with the windows VALUES list for a given N
+_WINDOW_EDGES_SQL_TEMPLATE = """
+    WITH windows(window_index, start_ts, end_ts) AS (VALUES {values})
+    SELECT
+        window_index,
+        (SELECT water_level_m FROM readings
+         WHERE station_id = :station_id AND timestamp BETWEEN start_ts AND end_ts
+         ORDER BY timestamp LIMIT 1),
+        (SELECT water_level_m FROM readings
+         WHERE station_id = :station_id AND timestamp BETWEEN start_ts AND end_ts
+         ORDER BY timestamp DESC LIMIT 1),
+        (SELECT COUNT(*) FROM readings
+         WHERE station_id = :station_id AND timestamp BETWEEN start_ts AND end_ts)
+    FROM windows
+    ORDER BY window_index
+"""
+
+
+@lru_cache(maxsize=8)
+def _window_edges_sql(window_count: int) -> str:
+    """Window-edges statement for a fixed number of windows."""
+    values = ", ".join(f"({i}, :start_{i}, :end_{i})" for i in range(window_count))
+    return _WINDOW_EDGES_SQL_TEMPLATE.format(values=values)
+
+
+_COUNT_READINGS_SQL = "SELECT COUNT(*) FROM readings WHERE station_id = ?"
+
+_MAX_READING_TIMESTAMP_SQL = "SELECT MAX(timestamp) FROM readings WHERE station_id = ?"
+
 
 class DataStore:
     """Manages SQLite database operations for groundwater data."""
@@ -27,13 +213,52 @@ class DataStore:
             db_path: Path to SQLite database file (defaults to config)
         """
         self.db_path = db_path or config.db_path
+        # Small bounded pool of idle connections shared by all threads
+        # (Streamlit reruns often start a new thread, so per-thread
+        # connections would grow without limit). Checkout never blocks;
+        # close() retires the pool, and connections released to a retired
+        # pool are closed instead of re-queued.
+        self._pool: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(maxsize=_CONNECTION_POOL_SIZE)
+        self._pool_lock = threading.Lock()
+        # Latest reading date per station; invalidated by save_readings and
+        # invalidate_caches. Writers bump _cache_generation, and a reader only
+        # stores a value if no bump happened while it was querying.
+        self._max_reading_date_cache: Dict[str, date] = {}
+        self._cache_lock = threading.Lock()
+        self._cache_generation = 0
+        # Window edges keyed by (station, window tuple); seasonal metrics
+        # for a station/reference date reuse them across reruns. Bounded by
+        # _WINDOWS_EDGES_CACHE_SIZE, invalidated and generation-guarded like
+        # _max_reading_date_cache.
+        self._windows_edges_cache: Dict[Tuple[str, Tuple[Tuple[datetime, datetime], ...]], list] = {}
         self._initialize_schema()
     
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open a new connection with the standard pragmas applied."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.executescript(_CONNECTION_PRAGMAS)
+        return conn
+    
+    def _release_connection(self, pool: queue.LifoQueue, conn: sqlite3.Connection) -> None:
+        """Return a connection to the pool it came from, or close it."""
+        with self._pool_lock:
+            if pool is self._pool:
+                try:
+                    pool.put_nowait(conn)
+                    return
+                except queue.Full:
+                    pass
+        conn.close()
+    
     @contextmanager
     def _get_connection(self):
-        """Context manager for database connections."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        """Context manager for a transaction on a pooled connection."""
+        pool = self._pool
+        try:
+            conn = pool.get_nowait()
+        except queue.Empty:
+            conn = self._open_connection()
         try:
             yield conn
             conn.commit()
@@ -41,6 +266,24 @@ class DataStore:
             conn.rollback()
             raise
         finally:
+            self._release_connection(pool, conn)
+    
+    def close(self) -> None:
+        """
+        Close all idle connections and retire the pool.
+        
+        Connections checked out at the time stay usable and are closed when
+        released. The data store stays usable and opens fresh connections.
+        """
+        with self._pool_lock:
+            pool, self._pool = self._pool, queue.LifoQueue(maxsize=_CONNECTION_POOL_SIZE)
+            idle = []
+            while True:
+                try:
+                    idle.append(pool.get_nowait())
+                except queue.Empty:
+                    break
+        for conn in idle:
             conn.close()
     
     def _initialize_schema(self):
@@ -48,6 +291,10 @@ class DataStore:
         with self._get_connection() as conn:
             cursor = conn.cursor()
             
+            # WAL lets dashboard reads proceed while readings are written;
+            # the mode is persistent, so it only needs setting once
+            cursor.execute("PRAGMA journal_mode=WAL")
+            
             # Stations table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS stations (
@@ -69,7 +316,7 @@ class DataStore:
                 CREATE TABLE IF NOT EXISTS readings (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     station_id TEXT NOT NULL,
-                    timestamp TIMESTAMP NOT NULL,
+                    timestamp INTEGER NOT NULL,
                     water_level_m REAL NOT NULL,
                     quality_flag TEXT,
                     source TEXT,
@@ -85,13 +332,13 @@ class DataStore:
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     station_id TEXT NOT NULL,
                     calculation_date TIMESTAMP NOT NULL,
-                    trend_indicator TEXT NOT NULL,
+                    trend_indicator INTEGER NOT NULL,
                     trend_magnitude REAL,
                     trend_period_days INTEGER,
                     seasonal_deviation REAL,
                     seasonal_baseline REAL,
                     risk_index REAL,
-                    risk_level TEXT,
+                    risk_level INTEGER,
                     data_points_used INTEGER,
                     calculation_notes TEXT,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
@@ -101,18 +348,61 @@ class DataStore:
             """)
             
             # Create indexes
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_readings_station_timestamp ON readings(station_id, timestamp)")
+            # Covering index: window scans read water_level_m straight from the
+            # index without visiting table rows. It supersedes the former
+            # (station_id, timestamp) index, which UNIQUE already provides.
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_readings_cover ON readings(station_id, timestamp, water_level_m)")
+            cursor.execute("DROP INDEX IF EXISTS idx_readings_station_timestamp")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_metrics_station_date ON metrics(station_id, calculation_date)")
+            
+            self._migrate_schema(cursor)
+    
+    def _migrate_schema(self, cursor: sqlite3.Cursor) -> None:
+        """Upgrade data written by older schema versions in place."""
+        version = cursor.execute("PRAGMA user_version").fetchone()[0]
+        
+        if version < 1:
+            # v1: reading timestamps moved from ISO text to epoch seconds.
+            # Text timestamps that differ only below one second collapse to
+            # the same value; keep the earliest row of each group so the
+            # rewrite cannot violate UNIQUE(station_id, timestamp).
+            cursor.execute("""
+                DELETE FROM readings
+                WHERE typeof(timestamp) = 'text'
+                  AND id NOT IN (
+                      SELECT MIN(id) FROM readings
+                      GROUP BY station_id,
+                               CASE WHEN typeof(timestamp) = 'text'
+                                    THEN CAST(strftime('%s', timestamp) AS INTEGER)
+                                    ELSE timestamp END
+                  )
+            """)
+            cursor.execute("""
+                UPDATE readings
+                SET timestamp = CAST(strftime('%s', timestamp) AS INTEGER)
+                WHERE typeof(timestamp) = 'text'
+            """)
+        
+        if version < 2:
+            # v2: metrics enums moved from label text to integer codes.
+            # Tables created before v2 keep TEXT column affinity, so codes
+            # read back as text there; readers apply int().
+            trend_cases = " ".join(f"WHEN '{trend.value}' THEN {code}" for trend, code in _TREND_CODES.items())
+            risk_cases = " ".join(f"WHEN '{risk.value}' THEN {code}" for risk, code in _RISK_CODES.items())
+            cursor.execute(f"""
+                UPDATE metrics
+                SET trend_indicator = CASE trend_indicator {trend_cases} ELSE trend_indicator END,
+                    risk_level = CASE risk_level {risk_cases} ELSE risk_level END
+            """)
+        
+        if version < _SCHEMA_VERSION:
+            cursor.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
     
     def save_station(self, station: Station) -> None:
-        """Save or update a station record."""
+        """Save or update a station record (updated in place on conflict)."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                INSERT OR REPLACE INTO stations 
-                (station_id, name, latitude, longitude, district, state, elevation_m, description, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+            cursor.execute(_SAVE_STATION_SQL, (
                 station.station_id,
                 station.name,
                 station.latitude,
@@ -124,43 +414,67 @@ class DataStore:
                 datetime.now()
             ))
     
-    def save_readings(self, readings: List[Reading]) -> None:
-        """Save multiple readings (insert or ignore duplicates)."""
+    def save_readings(self, readings: Iterable[Reading]) -> int:
+        """
+        Save multiple readings (insert or ignore duplicates).
+        
+        Rows are streamed into executemany, so any iterable of readings can
+        be saved without building an intermediate row list.
+        
+        Args:
+            readings: Readings to save
+        
+        Returns:
+            Number of readings actually inserted (duplicates excluded)
+        """
+        station_ids = set()
+        
+        def rows():
+            for r in readings:
+                station_ids.add(r.station_id)
+                yield (r.station_id, _to_epoch_seconds(r.timestamp), r.water_level_m, r.quality_flag, r.source)
+        
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            for reading in readings:
-                cursor.execute("""
-                    INSERT OR IGNORE INTO readings 
-                    (station_id, timestamp, water_level_m, quality_flag, source)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (
-                    reading.station_id,
-                    reading.timestamp,
-                    reading.water_level_m,
-                    reading.quality_flag,
-                    reading.source
-                ))
+            # Single statement for the whole batch; the connection context
+            # wraps it in one transaction and commits once
+            cursor.executemany(_SAVE_READING_SQL, rows())
+            inserted = cursor.rowcount
+        
+        with self._cache_lock:
+            self._cache_generation += 1
+            for station_id in station_ids:
+                self._max_reading_date_cache.pop(station_id, None)
+            for key in [key for key in self._windows_edges_cache if key[0] in station_ids]:
+                del self._windows_edges_cache[key]
+        return inserted
+    
+    def invalidate_caches(self) -> None:
+        """
+        Drop all cached query results.
+        
+        Needed when readings are written outside this DataStore (e.g. by a
+        separate ingest process), which save_readings cannot observe.
+        """
+        with self._cache_lock:
+            self._cache_generation += 1
+            self._max_reading_date_cache.clear()
+            self._windows_edges_cache.clear()
     
     def save_metrics(self, metrics: Metrics) -> None:
         """Save calculated metrics."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                INSERT OR REPLACE INTO metrics 
-                (station_id, calculation_date, trend_indicator, trend_magnitude, 
-                 trend_period_days, seasonal_deviation, seasonal_baseline, 
-                 risk_index, risk_level, data_points_used, calculation_notes)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+            cursor.execute(_SAVE_METRICS_SQL, (
                 metrics.station_id,
                 metrics.calculation_date,
-                metrics.trend_indicator.value,
+                _TREND_CODES[metrics.trend_indicator],
                 metrics.trend_magnitude,
                 metrics.trend_period_days,
                 metrics.seasonal_deviation,
                 metrics.seasonal_baseline,
                 metrics.risk_index,
-                metrics.risk_level.value if metrics.risk_level else None,
+                _RISK_CODES[metrics.risk_level] if metrics.risk_level else None,
                 metrics.data_points_used,
                 metrics.calculation_notes
             ))
@@ -169,7 +483,7 @@ class DataStore:
         """Retrieve a station by ID."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM stations WHERE station_id = ?", (station_id,))
+            cursor.execute(_SELECT_STATION_SQL, (station_id,))
             row = cursor.fetchone()
             if row:
                 return Station(
@@ -188,7 +502,7 @@ class DataStore:
         """Retrieve all stations."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM stations ORDER BY name")
+            cursor.execute(_SELECT_ALL_STATIONS_SQL)
             return [
                 Station(
                     station_id=row["station_id"],
@@ -208,34 +522,162 @@ class DataStore:
         station_id: str,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None
-    ) -> List[Reading]:
-        """Retrieve readings for a station within a date range."""
-        with self._get_connection() as conn:
+    ) -> Iterator[Reading]:
+        """
+        Retrieve readings for a station within a date range.
+        
+        Readings are yielded straight from the cursor in timestamp order, so
+        single-pass consumers never hold the whole range in memory. Use
+        get_readings_list when a list is needed.
+        """
+        # A suspended generator may live arbitrarily long, so stream from a
+        # dedicated connection rather than tying up one from the pool
+        conn = self._open_connection()
+        try:
             cursor = conn.cursor()
-            query = "SELECT * FROM readings WHERE station_id = ?"
-            params = [station_id]
-            
-            if start_date:
-                query += " AND timestamp >= ?"
-                params.append(start_date)
-            
-            if end_date:
-                query += " AND timestamp <= ?"
-                params.append(end_date)
-            
-            query += " ORDER BY timestamp"
-            cursor.execute(query, params)
-            
-            return [
-                Reading(
+            cursor.arraysize = _READINGS_FETCH_SIZE
+            cursor.execute(*self._readings_query(_SELECT_READINGS_SQL, station_id, start_date, end_date))
+            for row in cursor:
+                yield Reading(
                     station_id=row["station_id"],
-                    timestamp=datetime.fromisoformat(row["timestamp"]) if isinstance(row["timestamp"], str) else row["timestamp"],
+                    timestamp=_from_epoch_seconds(row["timestamp"]),
                     water_level_m=row["water_level_m"],
                     quality_flag=row["quality_flag"],
                     source=row["source"]
                 )
-                for row in cursor.fetchall()
+        finally:
+            conn.close()
+    
+    def get_readings_list(
+        self,
+        station_id: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[Reading]:
+        """Retrieve readings for a station within a date range as a list."""
+        return list(self.get_readings(station_id, start_date, end_date))
+    
+    def get_readings_arrays(
+        self,
+        station_id: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Retrieve readings for a station as parallel NumPy arrays.
+        
+        Column-oriented alternative to get_readings for analytics: rows are
+        loaded straight into arrays without building Reading objects.
+        
+        Returns:
+            Tuple of (timestamps as datetime64[s], water levels as float64),
+            ordered by timestamp
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            cursor.execute(*self._readings_query(_SELECT_READING_ARRAYS_SQL, station_id, start_date, end_date))
+            rows = np.array(cursor.fetchall(), dtype=_READING_ARRAY_DTYPE)
+        
+        timestamps = rows["timestamp"].astype("datetime64[s]")
+        water_levels = np.ascontiguousarray(rows["water_level_m"])
+        return timestamps, water_levels
+    
+    @staticmethod
+    def _readings_query(
+        queries: Dict[Tuple[bool, bool], str],
+        station_id: str,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime]
+    ) -> Tuple[str, List]:
+        """Pick the range query variant and build its parameters."""
+        has_start = start_date is not None
+        has_end = end_date is not None
+        params = [station_id]
+        if has_start:
+            params.append(_to_epoch_seconds_ceil(start_date))
+        if has_end:
+            params.append(_to_epoch_seconds(end_date))
+        return queries[has_start, has_end], params
+    
+    def get_window_edges(
+        self,
+        station_id: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> Optional[Tuple[float, float, int]]:
+        """
+        Get the first and last water level within a date window.
+        
+        Lets callers that only need window endpoints (seasonal change) skip
+        loading every reading; both bounds are inclusive.
+        
+        Args:
+            station_id: Station identifier
+            start_date: Window start
+            end_date: Window end
+        
+        Returns:
+            Tuple of (first water level, last water level, reading count),
+            or None if the window has no readings
+        """
+        return self.get_windows_edges(station_id, [(start_date, end_date)])[0]
+    
+    def get_windows_edges(
+        self,
+        station_id: str,
+        windows: List[Tuple[datetime, datetime]]
+    ) -> List[Optional[Tuple[float, float, int]]]:
+        """
+        Get first/last water levels for several date windows in one query.
+        
+        Results are cached (oldest evicted beyond _WINDOWS_EDGES_CACHE_SIZE)
+        until save_readings or invalidate_caches drops them.
+        
+        Args:
+            station_id: Station identifier
+            windows: Inclusive (start, end) pairs
+        
+        Returns:
+            One entry per window, in order: (first water level, last water
+            level, reading count), or None if the window has no readings
+        """
+        if not windows:
+            return []
+        
+        key = (station_id, tuple(windows))
+        cached = self._windows_edges_cache.get(key)
+        if cached is not None:
+            return list(cached)
+        
+        params = {"station_id": station_id}
+        for i, (start_date, end_date) in enumerate(windows):
+            params[f"start_{i}"] = _to_epoch_seconds_ceil(start_date)
+            params[f"end_{i}"] = _to_epoch_seconds(end_date)
+        
+        generation = self._cache_generation
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(_window_edges_sql(len(windows)), params)
+            edges = [
+                (first_level, last_level, count) if count else None
+                for _, first_level, last_level, count in cursor.fetchall()
             ]
+        
+        with self._cache_lock:
+            # A write since the query may have made edges stale
+            if self._cache_generation == generation:
+                if len(self._windows_edges_cache) >= _WINDOWS_EDGES_CACHE_SIZE:
+                    del self._windows_edges_cache[next(iter(self._windows_edges_cache))]
+                self._windows_edges_cache[key] = edges
+        return list(edges)
+    
+    def count_readings(self, station_id: str) -> int:
+        """Count stored readings for a station."""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(_COUNT_READINGS_SQL, (station_id,))
+            return cursor.fetchone()[0]
     
     def get_max_reading_date(self, station_id: str) -> Optional[date]:
         """
@@ -250,29 +692,55 @@ class DataStore:
         Returns:
             datetime.date of the latest reading, or None if no readings exist
         """
+        cached = self._max_reading_date_cache.get(station_id)
+        if cached is not None:
+            return cached
+        
+        generation = self._cache_generation
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                "SELECT MAX(timestamp) FROM readings WHERE station_id = ?",
-                (station_id,)
-            )
+            cursor.execute(_MAX_READING_TIMESTAMP_SQL, (station_id,))
             row = cursor.fetchone()
-            if row and row[0]:
-                max_timestamp = row[0]
-                # Handle both string and datetime types
-                if isinstance(max_timestamp, str):
-                    dt = datetime.fromisoformat(max_timestamp)
-                else:
-                    dt = max_timestamp
-                # Return as date
-                if isinstance(dt, datetime):
-                    return dt.date()
-                elif isinstance(dt, date):
-                    return dt
+        
+        if not row or row[0] is None:
             return None
+        
+        max_date = _from_epoch_seconds(row[0]).date()
+        with self._cache_lock:
+            # A write since the query may have made max_date stale
+            if self._cache_generation == generation:
+                self._max_reading_date_cache[station_id] = max_date
+        return max_date
     
     def get_latest_metrics(self, station_id: str) -> Optional[Metrics]:
-        """Retrieve the most recent metrics for a station."""
-        # TODO: Implement metrics retrieval
-        return None
+        """
+        Retrieve the most recent metrics for a station.
+        
+        Served by a backward scan of idx_metrics_station_date.
+        
+        Args:
+            station_id: Station identifier
+        
+        Returns:
+            Metrics with the latest calculation_date, or None if none are stored
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(_SELECT_LATEST_METRICS_SQL, (station_id,))
+            row = cursor.fetchone()
+            if row:
+                return Metrics(
+                    station_id=row["station_id"],
+                    calculation_date=datetime.fromisoformat(row["calculation_date"]),
+                    trend_indicator=_TREND_BY_CODE[int(row["trend_indicator"])],
+                    trend_magnitude=row["trend_magnitude"],
+                    trend_period_days=row["trend_period_days"],
+                    seasonal_deviation=row["seasonal_deviation"],
+                    seasonal_baseline=row["seasonal_baseline"],
+                    risk_index=row["risk_index"],
+                    risk_level=_RISK_BY_CODE[int(row["risk_level"])] if row["risk_level"] is not None else None,
+                    data_points_used=row["data_points_used"],
+                    calculation_notes=row["calculation_notes"]
+                )
+            return None
 
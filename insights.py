@@ -10,6 +10,28 @@ from models.metrics import Metrics, RiskLevel, TrendIndicator, TrendStrength, Se
 logger = logging.getLogger(__name__)
 
 
+# Trend sentence templates, filled with str.format(strength=..., magnitude=..., window_days=...)
+_TREND_TEMPLATES = {
+    TrendIndicator.RECHARGING: "Groundwater levels show a {strength}recharging trend{magnitude} over the past {window_days} days.",
+    TrendIndicator.DEPLETING: "Groundwater levels show a {strength}depleting trend{magnitude} over the past {window_days} days.",
+    TrendIndicator.STABLE: "Groundwater levels have remained relatively stable over the past {window_days} days.",
+}
+
+# Risk sentence parts per level: (label, implication)
+_RISK_TEXT = {
+    RiskLevel.LOW: ("LOW", "indicating sustainable conditions."),
+    RiskLevel.MODERATE: ("MODERATE", "suggesting careful monitoring is warranted."),
+    RiskLevel.HIGH: ("HIGH", "indicating potential sustainability concerns."),
+    RiskLevel.CRITICAL: ("CRITICAL", "requiring immediate attention and management intervention."),
+}
+
+# Strength qualifier inserted before the trend; omitted for low strength
+_STRENGTH_TEXT = {
+    strength: "" if strength == TrendStrength.LOW else f"**{strength.value.lower()}-strength** "
+    for strength in TrendStrength
+}
+
+
 class InsightInterpreter:
     """Generates human-readable interpretations of groundwater metrics."""
     
@@ -32,45 +54,36 @@ class InsightInterpreter:
         risk_text = self._risk_explanation(metrics)
         
         # Combine into coherent narrative
-        insight = f"{trend_text}"
-        
-        if seasonal_text:
-            insight += f" {seasonal_text}"
-        
-        if risk_text:
-            insight += f" {risk_text}"
-        
-        return insight
+        return " ".join(text for text in (trend_text, seasonal_text, risk_text) if text)
     
     def _trend_explanation(self, metrics: Metrics) -> str:
         """Generate explanation for trend indicator."""
         # Use detailed trend_metrics if available, otherwise fall back to basic metrics
         if metrics.trend_metrics:
             trend_metrics = metrics.trend_metrics
-            strength_text = f"**{trend_metrics.strength.value.lower()}-strength** " if trend_metrics.strength != TrendStrength.LOW else ""
-            magnitude_text = f" by {abs(trend_metrics.magnitude):.2f} meters" if trend_metrics.magnitude else ""
-            
-            if trend_metrics.status == TrendIndicator.RECHARGING:
-                return f"Groundwater levels show a {strength_text}recharging trend{magnitude_text} over the past {trend_metrics.window_days} days."
-            elif trend_metrics.status == TrendIndicator.DEPLETING:
-                return f"Groundwater levels show a {strength_text}depleting trend{magnitude_text} over the past {trend_metrics.window_days} days."
-            elif trend_metrics.status == TrendIndicator.STABLE:
-                return f"Groundwater levels have remained relatively stable over the past {trend_metrics.window_days} days."
+            template = _TREND_TEMPLATES.get(trend_metrics.status)
+            if template:
+                return template.format(
+                    strength=_STRENGTH_TEXT[trend_metrics.strength],
+                    magnitude=self._magnitude_text(trend_metrics.magnitude),
+                    window_days=trend_metrics.window_days
+                )
         
         # Fallback to basic metrics if trend_metrics not available
-        if metrics.trend_indicator == TrendIndicator.RECHARGING:
-            magnitude_text = f" by {abs(metrics.trend_magnitude):.2f} meters" if metrics.trend_magnitude else ""
-            return f"Groundwater levels show a recharging trend{magnitude_text} over the past {metrics.trend_period_days} days."
-        
-        elif metrics.trend_indicator == TrendIndicator.DEPLETING:
-            magnitude_text = f" by {abs(metrics.trend_magnitude):.2f} meters" if metrics.trend_magnitude else ""
-            return f"Groundwater levels show a depleting trend{magnitude_text} over the past {metrics.trend_period_days} days."
-        
-        elif metrics.trend_indicator == TrendIndicator.STABLE:
-            return f"Groundwater levels have remained relatively stable over the past {metrics.trend_period_days} days."
+        template = _TREND_TEMPLATES.get(metrics.trend_indicator)
+        if template:
+            return template.format(
+                strength="",
+                magnitude=self._magnitude_text(metrics.trend_magnitude),
+                window_days=metrics.trend_period_days
+            )
         
-        else:
-            return "Trend analysis could not be completed due to insufficient data."
+        return "Trend analysis could not be completed due to insufficient data."
+    
+    @staticmethod
+    def _magnitude_text(magnitude: Optional[float]) -> str:
+        """Format the trend magnitude clause, empty when zero or unknown."""
+        return f" by {abs(magnitude):.2f} meters" if magnitude else ""
     
     def _seasonal_explanation(self, metrics: Metrics) -> Optional[str]:
         """Generate explanation for seasonal deviation."""
@@ -112,21 +125,12 @@ class InsightInterpreter:
         if metrics.risk_level is None or metrics.risk_index is None:
             return None
         
-        risk_index = metrics.risk_index
-        
-        if metrics.risk_level == RiskLevel.LOW:
-            return f"Overall groundwater stress risk is LOW (index: {risk_index:.1f}/100), indicating sustainable conditions."
-        
-        elif metrics.risk_level == RiskLevel.MODERATE:
-            return f"Overall groundwater stress risk is MODERATE (index: {risk_index:.1f}/100), suggesting careful monitoring is warranted."
-        
-        elif metrics.risk_level == RiskLevel.HIGH:
-            return f"Overall groundwater stress risk is HIGH (index: {risk_index:.1f}/100), indicating potential sustainability concerns."
-        
-        elif metrics.risk_level == RiskLevel.CRITICAL:
-            return f"Overall groundwater stress risk is CRITICAL (index: {risk_index:.1f}/100), requiring immediate attention and management intervention."
+        risk_text = _RISK_TEXT.get(metrics.risk_level)
+        if risk_text is None:
+            return None
         
-        return None
+        label, implication = risk_text
+        return f"Overall groundwater stress risk is {label} (index: {metrics.risk_index:.1f}/100), {implication}"
     
     def _insufficient_data_message(self, metrics: Metrics) -> str:
         """Message when data is insufficient for analysis."""
@@ -34,7 +34,7 @@ class TrendStrength(str, Enum):
     STRONG = "Strong"
 
 
-@dataclass
+@dataclass(slots=True)
 class TrendMetrics:
     """
     Detailed trend analysis metrics from linear regression.
@@ -57,7 +57,7 @@ class TrendMetrics:
     data_points_used: int
 
 
-@dataclass
+@dataclass(slots=True)
 class SeasonalMetrics:
     """
     Seasonal deviation metrics from rolling 90-day window analysis.
@@ -77,7 +77,7 @@ class SeasonalMetrics:
     years_used: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Metrics:
     """Calculated metrics for a groundwater monitoring station."""
     
@@ -7,7 +7,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Reading:
     """Represents a single groundwater level reading from a DWLR station."""
     
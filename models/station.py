@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Station:
     """Represents a groundwater monitoring station (DWLR well)."""
     
@@ -4,13 +4,33 @@ Seasonal deviation calculation engine using rolling 90-day windows.
 
 import logging
 from datetime import datetime, timedelta
-from typing import List, Optional
+from operator import attrgetter
+from typing import List, Optional, Tuple
+
+import numpy as np
 
 from models.metrics import SeasonalMetrics
 from models.reading import Reading
 
 logger = logging.getLogger(__name__)
 
+# Season label per calendar month, indexed by month number (index 0 unused)
+_SEASON_BY_MONTH = (
+    None,
+    "Winter",                # Jan
+    "Winter",                # Feb
+    "Summer / Pre-Monsoon",  # Mar
+    "Summer / Pre-Monsoon",  # Apr
+    "Summer / Pre-Monsoon",  # May
+    "Monsoon",               # Jun
+    "Monsoon",               # Jul
+    "Monsoon",               # Aug
+    "Monsoon",               # Sep
+    "Post-Monsoon",          # Oct
+    "Post-Monsoon",          # Nov
+    "Winter",                # Dec
+)
+
 
 class SeasonalEngine:
     """Engine for calculating seasonal deviation from historical baselines."""
@@ -20,16 +40,19 @@ class SeasonalEngine:
         readings: List[Reading],
         window_days: int = 90,
         years: int = 3,
-        reference_date: Optional[datetime] = None
+        reference_date: Optional[datetime] = None,
+        presorted: bool = False
     ) -> Optional[SeasonalMetrics]:
         """
         Calculate seasonal deviation using rolling 90-day windows.
         
         Args:
-            readings: List of Reading objects (should be sorted by timestamp)
+            readings: List of Reading objects
             window_days: Analysis window size in days (default 90)
             years: Number of historical years to compare (default 3)
             reference_date: Data-derived reference date (anchor for windows)
+            presorted: Readings are already in timestamp order (e.g. from
+                DataStore.get_readings), so the sorted copy is skipped
         
         Returns:
             SeasonalMetrics object or None if insufficient data
@@ -38,45 +61,166 @@ class SeasonalEngine:
             logger.warning("No readings provided for seasonal deviation calculation")
             return None
         
-        # Sort readings by timestamp
-        sorted_readings = sorted(readings, key=lambda r: r.timestamp)
+        # A window change needs two points; bail out before sorting/copying
+        if len(readings) < 2:
+            logger.warning("Insufficient data for seasonal deviation: current window needs at least 2 points")
+            return None
+        
+        # Sort readings by timestamp unless the caller guarantees order
+        sorted_readings = readings if presorted else sorted(readings, key=attrgetter("timestamp"))
         
         # Use data-derived reference_date as anchor (Step 3.5 time contract)
         if reference_date is None:
             reference_date = sorted_readings[-1].timestamp
+        
+        # Columnar copies: timestamps at microsecond resolution (exact for
+        # datetime), missing levels as NaN
+        count = len(sorted_readings)
+        timestamps = np.fromiter(
+            (r.timestamp for r in sorted_readings), dtype="datetime64[us]", count=count
+        )
+        levels = np.fromiter(
+            (np.nan if r.water_level_m is None else r.water_level_m for r in sorted_readings),
+            dtype=np.float64,
+            count=count
+        )
+        
+        return self.calculate_seasonal_deviation_arrays(
+            timestamps, levels, reference_date, window_days, years
+        )
+    
+    def calculate_seasonal_deviation_arrays(
+        self,
+        timestamps: np.ndarray,
+        levels: np.ndarray,
+        reference_date: datetime,
+        window_days: int = 90,
+        years: int = 3
+    ) -> Optional[SeasonalMetrics]:
+        """
+        Calculate seasonal deviation from parallel timestamp/level arrays.
+        
+        Window bounds are located by binary search, so each window costs
+        O(log N) instead of a scan over every reading.
+        
+        Args:
+            timestamps: Sorted datetime64 array of reading times
+            levels: Water levels (m) aligned with timestamps; NaN = missing
+            reference_date: Data-derived reference date (anchor for windows)
+            window_days: Analysis window size in days (default 90)
+            years: Number of historical years to compare (default 3)
+        
+        Returns:
+            SeasonalMetrics object or None if insufficient data
+        
+        Raises:
+            ValueError: If timestamps are not in ascending order
+        """
+        # Binary search below silently returns wrong windows on unsorted input
+        if (timestamps[1:] < timestamps[:-1]).any():
+            raise ValueError("timestamps must be sorted")
+        
+        windows = self._comparison_windows(reference_date, window_days, years)
+        
+        # Change (last - first) over each window, None if under 2 points
+        window_changes = []
+        for start_date, end_date in windows:
+            lo = np.searchsorted(timestamps, np.datetime64(start_date), side="left")
+            hi = np.searchsorted(timestamps, np.datetime64(end_date), side="right")
+            window_levels = levels[lo:hi]
+            window_levels = window_levels[~np.isnan(window_levels)]
+            if window_levels.size >= 2:
+                window_changes.append(float(window_levels[-1] - window_levels[0]))
+            else:
+                window_changes.append(None)
+            
+            # Without a current-window change no baseline is needed
+            if window_changes[0] is None:
+                break
+        
+        return self._metrics_from_changes(window_changes, reference_date)
+    
+    def calculate_seasonal_deviation_from_store(
+        self,
+        data_store,
+        station_id: str,
+        reference_date: datetime,
+        window_days: int = 90,
+        years: int = 3
+    ) -> Optional[SeasonalMetrics]:
+        """
+        Calculate seasonal deviation directly from stored readings.
+        
+        Same result as calculate_seasonal_deviation over the station's full
+        history, but only the first/last level of each window is read from
+        the database, in one query (via DataStore.get_windows_edges).
+        
+        Args:
+            data_store: DataStore holding the station's readings
+            station_id: Station identifier
+            reference_date: Data-derived reference date (anchor for windows)
+            window_days: Analysis window size in days (default 90)
+            years: Number of historical years to compare (default 3)
+        
+        Returns:
+            SeasonalMetrics object or None if insufficient data
+        """
+        windows = self._comparison_windows(reference_date, window_days, years)
+        
+        # All windows' edges in a single database round trip
+        window_changes = []
+        for edges in data_store.get_windows_edges(station_id, windows):
+            if edges is not None and edges[2] >= 2:
+                first_level, last_level, _ = edges
+                window_changes.append(last_level - first_level)
+            else:
+                window_changes.append(None)
+        
+        return self._metrics_from_changes(window_changes, reference_date)
+    
+    @staticmethod
+    def _comparison_windows(
+        reference_date: datetime,
+        window_days: int,
+        years: int
+    ) -> List[Tuple[datetime, datetime]]:
+        """
+        Build the current window followed by the same window in each
+        previous year, as inclusive (start, end) pairs.
+        """
         end_date = reference_date
         start_date = end_date - timedelta(days=window_days)
+        windows = [(start_date, end_date)]
+        for year in range(1, years + 1):
+            windows.append((
+                start_date - timedelta(days=year * 365),
+                end_date - timedelta(days=year * 365)
+            ))
+        return windows
+    
+    def _metrics_from_changes(
+        self,
+        window_changes: List[Optional[float]],
+        reference_date: datetime
+    ) -> Optional[SeasonalMetrics]:
+        """
+        Build SeasonalMetrics from per-window changes.
         
-        # Filter to current rolling window
-        actual_window = [
-            r for r in sorted_readings
-            if start_date <= r.timestamp <= end_date and r.water_level_m is not None
-        ]
-        
-        if len(actual_window) < 2:
-            logger.warning(
-                f"Insufficient data for seasonal deviation: {len(actual_window)} points "
-                f"(need at least 2)"
-            )
-            return None
+        Args:
+            window_changes: Change for the current window followed by each
+                historical window; None where a window had under 2 points
+            reference_date: Reference date (end of the current window)
         
-        # Calculate actual change (last - first)
-        actual_change = actual_window[-1].water_level_m - actual_window[0].water_level_m
+        Returns:
+            SeasonalMetrics object or None if insufficient data
+        """
+        actual_change = window_changes[0]
+        if actual_change is None:
+            logger.warning("Insufficient data for seasonal deviation: current window needs at least 2 points")
+            return None
         
         # Collect historical 90-day changes from previous years
-        historical_changes = []
-        for year in range(1, years + 1):
-            target_start = start_date - timedelta(days=year * 365)
-            target_end = end_date - timedelta(days=year * 365)
-            
-            historical_window = [
-                r for r in sorted_readings
-                if target_start <= r.timestamp <= target_end and r.water_level_m is not None
-            ]
-            
-            if len(historical_window) >= 2:
-                historical_change = historical_window[-1].water_level_m - historical_window[0].water_level_m
-                historical_changes.append(historical_change)
+        historical_changes = [change for change in window_changes[1:] if change is not None]
         
         if not historical_changes:
             logger.info("No valid historical windows found for seasonal baseline")
@@ -89,7 +233,7 @@ class SeasonalEngine:
         deviation = actual_change - historical_baseline
         
         # Get season label for current period
-        season_label = self.get_season_label(end_date)
+        season_label = self.get_season_label(reference_date)
         
         return SeasonalMetrics(
             actual_change=actual_change,
@@ -110,13 +254,4 @@ class SeasonalEngine:
         Returns:
             Season label string
         """
-        month = date.month
-        
-        if month in [3, 4, 5]:
-            return "Summer / Pre-Monsoon"
-        elif month in [6, 7, 8, 9]:
-            return "Monsoon"
-        elif month in [10, 11]:
-            return "Post-Monsoon"
-        else:  # 12, 1, 2
-            return "Winter"
+        return _SEASON_BY_MONTH[date.month]
@@ -3,8 +3,9 @@ Trend calculation engine using linear regression analysis.
 """
 
 import logging
-from datetime import datetime, timedelta
-from typing import List, Optional
+from dataclasses import replace
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 
@@ -21,14 +22,50 @@ NOISE_FLOOR = 0.0005  # m/day - slopes below this magnitude are considered noise
 LOW_STRENGTH_THRESHOLD = 0.0007
 MEDIUM_STRENGTH_THRESHOLD = 0.0015
 
+# Timestamps are reduced to int64 microseconds since the epoch so window
+# and day-delta arithmetic is plain integer math (exact for datetime)
+_MICROSECONDS_PER_DAY = 86_400_000_000
+
+# Maximum memoized trend results per engine (oldest evicted first)
+_TREND_CACHE_SIZE = 4096
+
+
+def _ols_slope(x_values: np.ndarray, y_values: np.ndarray) -> float:
+    """
+    Least-squares slope of y over x, in closed form.
+    
+    Mean-centered: slope = S(dx*dy) / S(dx*dx) with dx = x - mean(x),
+    dy = y - mean(y). Centering avoids the cancellation between large,
+    nearly equal terms in n*Sxy - Sx*Sy, which matters for the ~1e-4 m/day
+    slopes seen here. Identical y values give a zero numerator; identical x
+    values (no time spread) give a zero denominator, treated as slope 0.0.
+    """
+    dx = x_values - x_values.mean()
+    dy = y_values - y_values.mean()
+    denominator = np.dot(dx, dx)
+    if denominator == 0:
+        return 0.0
+    return float(np.dot(dx, dy) / denominator)
+
 
 class TrendEngine:
     """Engine for calculating groundwater level trends using linear regression."""
     
+    def __init__(self):
+        """Initialize trend engine."""
+        # Memoized results keyed by (station_id, latest timestamp in
+        # microseconds, reading count, window_days)
+        self._trend_cache: Dict[Tuple[str, int, int, int], Optional[TrendMetrics]] = {}
+    
+    def invalidate_cache(self) -> None:
+        """Drop memoized trend results (e.g. after readings are corrected)."""
+        self._trend_cache.clear()
+    
     def calculate_trend(
         self,
         readings: List[Reading],
-        window_days: int = 90
+        window_days: int = 90,
+        assume_sorted: bool = True
     ) -> Optional[TrendMetrics]:
         """
         Calculate trend using linear regression over last N days.
@@ -37,59 +74,261 @@ class TrendEngine:
         irregular sampling correctly.
         
         Args:
-            readings: List of Reading objects (should be sorted by timestamp)
+            readings: List of Reading objects
             window_days: Analysis window in days (default 90)
+            assume_sorted: Readings are already in timestamp order (as
+                returned by DataStore.get_readings); pass False to sort here
         
         Returns:
             TrendMetrics object or None if insufficient data (< 2 points)
+        
+        Raises:
+            ValueError: If assume_sorted is True but readings are out of order
         """
         if not readings:
             logger.warning("No readings provided for trend calculation")
             return None
         
-        # Filter to last N days from latest reading
-        latest_date = max(r.timestamp for r in readings)
-        cutoff_date = latest_date - timedelta(days=window_days)
-        filtered_readings = [
-            r for r in readings
-            if r.timestamp >= cutoff_date and r.water_level_m is not None
-        ]
+        # Regression needs 2 points; reject before building any arrays
+        if len(readings) < 2:
+            logger.warning(
+                f"Insufficient data for trend: {len(readings)} points "
+                f"(need at least 2)"
+            )
+            return None
+        
+        # Columnar copies: timestamps at microsecond resolution (exact for
+        # datetime), missing levels as NaN
+        count = len(readings)
+        timestamps = np.fromiter(
+            (r.timestamp for r in readings), dtype="datetime64[us]", count=count
+        )
+        levels = np.fromiter(
+            (np.nan if r.water_level_m is None else r.water_level_m for r in readings),
+            dtype=np.float64,
+            count=count
+        )
         
-        # Need at least 2 points for linear regression
-        if len(filtered_readings) < 2:
+        if not assume_sorted:
+            return self.calculate_trend_unsorted(timestamps, levels, window_days, readings[0].station_id)
+        return self.calculate_trend_arrays(timestamps, levels, window_days, readings[0].station_id)
+    
+    def calculate_trend_unsorted(
+        self,
+        timestamps: np.ndarray,
+        levels: np.ndarray,
+        window_days: int = 90,
+        station_id: Optional[str] = None
+    ) -> Optional[TrendMetrics]:
+        """
+        Calculate trend from arrays in arbitrary order.
+        
+        Orders the arrays with one stable argsort, then defers to
+        calculate_trend_arrays.
+        """
+        order = np.argsort(timestamps, kind="stable")
+        return self.calculate_trend_arrays(timestamps[order], levels[order], window_days, station_id)
+    
+    def calculate_trend_arrays(
+        self,
+        timestamps: np.ndarray,
+        levels: np.ndarray,
+        window_days: int = 90,
+        station_id: Optional[str] = None
+    ) -> Optional[TrendMetrics]:
+        """
+        Calculate trend from parallel timestamp/level arrays.
+        
+        Same analysis as calculate_trend without per-reading objects.
+        
+        When station_id is given, results are memoized by station, latest
+        timestamp, reading count and window. Readings are assumed to be
+        append-only; call invalidate_cache if stored levels are rewritten.
+        
+        Timestamps must already be in ascending order; use
+        calculate_trend_unsorted otherwise.
+        
+        Args:
+            timestamps: Sorted datetime64 array of reading times
+            levels: Water levels (m) aligned with timestamps; NaN = missing
+            window_days: Analysis window in days (default 90)
+            station_id: Station identifier, used for logging and as the
+                memoization key (no caching without it)
+        
+        Returns:
+            TrendMetrics object or None if insufficient data (< 2 points)
+        
+        Raises:
+            ValueError: If timestamps are not in ascending order
+        """
+        if timestamps.size == 0:
+            logger.warning("No readings provided for trend calculation")
+            return None
+        
+        # Regression needs 2 points; skip cache lookup and windowing
+        if timestamps.size < 2:
+            logger.warning(
+                f"Insufficient data for trend: {timestamps.size} points "
+                f"(need at least 2)"
+            )
+            return None
+        
+        if station_id is None:
+            return self._compute_trend(timestamps, levels, window_days, station_id)
+        
+        key = (
+            station_id,
+            int(timestamps[-1].astype("datetime64[us]").astype(np.int64)),
+            int(timestamps.size),
+            window_days
+        )
+        if key in self._trend_cache:
+            cached = self._trend_cache[key]
+            # Hand out a copy so callers cannot alter the memoized result
+            return replace(cached) if cached is not None else None
+        
+        trend_metrics = self._compute_trend(timestamps, levels, window_days, station_id)
+        
+        if len(self._trend_cache) >= _TREND_CACHE_SIZE:
+            del self._trend_cache[next(iter(self._trend_cache))]
+        self._trend_cache[key] = trend_metrics
+        return replace(trend_metrics) if trend_metrics is not None else None
+    
+    def calculate_trend_batch(
+        self,
+        series_by_station: Dict[str, Tuple[np.ndarray, np.ndarray]],
+        window_days: int = 90
+    ) -> Dict[str, Optional[TrendMetrics]]:
+        """
+        Calculate trends for many stations in one vectorized pass.
+        
+        Each station's window is cut out as in calculate_trend_arrays; the
+        windows are then concatenated and the regression sums for every
+        station are reduced together with np.add.reduceat.
+        
+        Args:
+            series_by_station: Station ID -> (sorted datetime64 timestamps,
+                float64 levels with NaN for missing values)
+            window_days: Analysis window in days (default 90)
+        
+        Returns:
+            Station ID -> TrendMetrics, or None where a station has
+            insufficient data (< 2 points)
+        """
+        results: Dict[str, Optional[TrendMetrics]] = {}
+        station_ids = []
+        x_parts = []
+        y_parts = []
+        for station_id, (timestamps, levels) in series_by_station.items():
+            window = self._window_series(timestamps, levels, window_days) if timestamps.size else None
+            if window is None:
+                results[station_id] = None
+                continue
+            station_ids.append(station_id)
+            x_parts.append(window[0])
+            y_parts.append(window[1])
+        
+        if station_ids:
+            counts = np.fromiter((x.size for x in x_parts), dtype=np.int64, count=len(x_parts))
+            offsets = np.concatenate(([0], np.cumsum(counts[:-1])))
+            x_values = np.concatenate(x_parts)
+            y_values = np.concatenate(y_parts)
+            
+            # Per-station means, then mean-centered sums as in _ols_slope
+            x_means = np.add.reduceat(x_values, offsets) / counts
+            y_means = np.add.reduceat(y_values, offsets) / counts
+            dx = x_values - np.repeat(x_means, counts)
+            dy = y_values - np.repeat(y_means, counts)
+            
+            denominators = np.add.reduceat(dx * dx, offsets)
+            numerators = np.add.reduceat(dx * dy, offsets)
+            # Zero denominator (no time spread) means slope 0.0, as in _ols_slope
+            slopes = np.divide(
+                numerators, denominators,
+                out=np.zeros_like(numerators), where=denominators != 0
+            )
+            
+            for station_id, slope, count in zip(station_ids, slopes.tolist(), counts.tolist()):
+                results[station_id] = self._classify_trend(slope, window_days, count)
+        
+        return results
+    
+    def _window_series(
+        self,
+        timestamps: np.ndarray,
+        levels: np.ndarray,
+        window_days: int
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Cut the trend window out of a non-empty sorted series.
+        
+        Returns:
+            Tuple of (day deltas from the first window reading as float64,
+            water levels), or None if the window has fewer than 2 points
+        
+        Raises:
+            ValueError: If timestamps are not in ascending order
+        """
+        ticks = timestamps.astype("datetime64[us]", copy=False).view(np.int64)
+        if (ticks[1:] < ticks[:-1]).any():
+            raise ValueError(
+                "timestamps must be sorted; use calculate_trend_unsorted "
+                "or assume_sorted=False"
+            )
+        
+        # Filter to last N days from latest reading: binary search for the
+        # window start on the sorted timestamps, then drop missing levels
+        cutoff = ticks[-1] - window_days * _MICROSECONDS_PER_DAY
+        start = np.searchsorted(ticks, cutoff, side="left")
+        if ticks.size - start < 2:
             logger.warning(
-                f"Insufficient data for trend: {len(filtered_readings)} points "
+                f"Insufficient data for trend: {ticks.size - start} points "
                 f"(need at least 2)"
             )
             return None
+        window_ticks = ticks[start:]
+        y_values = levels[start:]
+        present = ~np.isnan(y_values)
+        if not present.all():
+            window_ticks = window_ticks[present]
+            y_values = y_values[present]
         
-        # Sort by timestamp to ensure chronological order
-        filtered_readings.sort(key=lambda r: r.timestamp)
+        # Need at least 2 points for linear regression
+        if y_values.size < 2:
+            logger.warning(
+                f"Insufficient data for trend: {y_values.size} points "
+                f"(need at least 2)"
+            )
+            return None
         
         # Extract data for regression
-        # Use actual day deltas from first timestamp (not index positions)
-        first_timestamp = filtered_readings[0].timestamp
-        x_values = np.array([
-            (r.timestamp - first_timestamp).days
-            for r in filtered_readings
-        ])
-        y_values = np.array([
-            r.water_level_m
-            for r in filtered_readings
-        ])
-        
-        # Handle edge case: all readings identical (zero variance)
-        if np.all(y_values == y_values[0]):
-            slope = 0.0
-            logger.info("All readings identical, slope = 0.0")
-            print("TREND DEBUG", readings[0].station_id, "slope =", slope)
-        else:
-            # Perform linear regression: y = slope * x + intercept
-            # Using numpy.polyfit with degree 1
-            coefficients = np.polyfit(x_values, y_values, deg=1)
-            slope = float(coefficients[0])  # m/day
-            print("TREND DEBUG", readings[0].station_id, "slope =", slope)
+        # Use actual day deltas from first timestamp (not index positions),
+        # whole days rounded down as with timedelta.days
+        x_values = ((window_ticks - window_ticks[0]) // _MICROSECONDS_PER_DAY).astype(np.float64)
+        return x_values, y_values
+    
+    def _compute_trend(
+        self,
+        timestamps: np.ndarray,
+        levels: np.ndarray,
+        window_days: int,
+        station_id: Optional[str]
+    ) -> Optional[TrendMetrics]:
+        """Run the windowed regression and classification (uncached)."""
+        window = self._window_series(timestamps, levels, window_days)
+        if window is None:
+            return None
+        x_values, y_values = window
+        
+        # Linear regression: y = slope * x + intercept
+        slope = _ols_slope(x_values, y_values)  # m/day
+        logger.debug("Trend slope for %s: %s m/day", station_id, slope)
         
+        return self._classify_trend(slope, window_days, int(y_values.size))
+    
+    @staticmethod
+    def _classify_trend(slope: float, window_days: int, data_points_used: int) -> TrendMetrics:
+        """Build TrendMetrics (status, strength, magnitude) from a slope."""
         # Classify trend status
         # For depth below ground: negative slope = Recharging (water rising), positive slope = Depleting (water falling)
         # Use noise dead-zone to avoid classifying small slopes as trends
@@ -122,6 +361,5 @@ class TrendEngine:
             strength=strength,
             magnitude=magnitude,
             window_days=window_days,
-            data_points_used=len(filtered_readings)
+            data_points_used=data_points_used
         )
-
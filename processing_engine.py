@@ -7,9 +7,9 @@ from datetime import datetime, timedelta
 from typing import List, Optional, Tuple
 
 import numpy as np
-import pandas as pd
 
 from config import config
+from data_store import DataStore
 from models.metrics import Metrics, RiskLevel, TrendIndicator
 from models.reading import Reading
 from processing.trend_engine import TrendEngine
@@ -30,28 +30,89 @@ class ProcessingEngine:
         self.trend_engine = TrendEngine()
         self.seasonal_engine = SeasonalEngine()
     
-    def calculate_metrics(self, readings: List[Reading], calculation_date: Optional[datetime] = None) -> Metrics:
+    def calculate_metrics(
+        self,
+        readings: List[Reading],
+        calculation_date: Optional[datetime] = None,
+        data_store: Optional[DataStore] = None,
+        assume_sorted: bool = True
+    ) -> Metrics:
         """
         Calculate all metrics for a set of readings.
         
         Args:
             readings: List of Reading objects
             calculation_date: Date for calculation (defaults to latest reading date)
+            data_store: Optional DataStore holding the station's history; when
+                given, seasonal windows are read from it directly instead of
+                being filtered out of ``readings``
+            assume_sorted: Readings are already in timestamp order; pass
+                False to sort them once here before analysis
         
         Returns:
             Metrics object with calculated values
+        
+        Raises:
+            ValueError: If assume_sorted is True but readings are out of order
         """
         if not readings:
             return self._create_empty_metrics(readings, calculation_date)
         
-        calculation_date = calculation_date or max(r.timestamp for r in readings)
-        station_id = readings[0].station_id
+        # Columnar copy built once and shared by trend and seasonal analysis
+        timestamps, levels = self._readings_to_arrays(readings)
+        
+        if not assume_sorted:
+            # One stable argsort on the array instead of a keyed list sort
+            order = np.argsort(timestamps, kind="stable")
+            timestamps = timestamps[order]
+            levels = levels[order]
+        
+        return self.calculate_metrics_arrays(
+            readings[0].station_id,
+            timestamps,
+            levels,
+            calculation_date=calculation_date,
+            data_store=data_store
+        )
+    
+    def calculate_metrics_arrays(
+        self,
+        station_id: str,
+        timestamps: np.ndarray,
+        levels: np.ndarray,
+        calculation_date: Optional[datetime] = None,
+        data_store: Optional[DataStore] = None
+    ) -> Metrics:
+        """
+        Calculate all metrics from parallel timestamp/level arrays.
+        
+        Array form of calculate_metrics, e.g. for DataStore.get_readings_arrays
+        output.
+        
+        Args:
+            station_id: Station identifier
+            timestamps: Sorted datetime64 array of reading times
+            levels: Water levels (m) aligned with timestamps; NaN = missing
+            calculation_date: Date for calculation (defaults to latest reading date)
+            data_store: Optional DataStore holding the station's history; when
+                given, seasonal windows are read from it directly
+        
+        Returns:
+            Metrics object with calculated values
+        """
+        if timestamps.size == 0:
+            return self._create_empty_metrics([], calculation_date, station_id)
         
-        # Convert to DataFrame for easier processing
-        df = self._readings_to_dataframe(readings)
+        calculation_date = calculation_date or timestamps[-1].astype("datetime64[us]").item()
         
-        # Calculate trend using TrendEngine
-        trend_metrics = self.trend_engine.calculate_trend(readings, self.trend_window_days)
+        # Calculate trend using TrendEngine; a single reading cannot define
+        # a slope, so skip the call outright
+        if timestamps.size >= 2:
+            trend_metrics = self.trend_engine.calculate_trend_arrays(
+                timestamps, levels, self.trend_window_days, station_id
+            )
+        else:
+            trend_metrics = None
         
         if trend_metrics:
             trend_indicator = trend_metrics.status
@@ -61,12 +122,22 @@ class ProcessingEngine:
             trend_magnitude = None
         
         # Calculate seasonal deviation using SeasonalEngine
-        seasonal_metrics = self.seasonal_engine.calculate_seasonal_deviation(
-            readings,
-            self.trend_window_days,
-            self.seasonal_comparison_years,
-            reference_date=calculation_date
-        )
+        if data_store is not None:
+            seasonal_metrics = self.seasonal_engine.calculate_seasonal_deviation_from_store(
+                data_store,
+                station_id,
+                calculation_date,
+                self.trend_window_days,
+                self.seasonal_comparison_years
+            )
+        else:
+            seasonal_metrics = self.seasonal_engine.calculate_seasonal_deviation_arrays(
+                timestamps,
+                levels,
+                calculation_date,
+                self.trend_window_days,
+                self.seasonal_comparison_years
+            )
         
         if seasonal_metrics:
             seasonal_deviation = seasonal_metrics.deviation
@@ -90,55 +161,27 @@ class ProcessingEngine:
             seasonal_metrics=seasonal_metrics,      # Detailed seasonal analysis
             risk_index=risk_index,
             risk_level=risk_level,
-            data_points_used=len(readings)
+            data_points_used=int(timestamps.size)
         )
     
-    def _readings_to_dataframe(self, readings: List[Reading]) -> pd.DataFrame:
-        """Convert readings list to pandas DataFrame."""
-        return pd.DataFrame([
-            {
-                "timestamp": r.timestamp,
-                "water_level_m": r.water_level_m
-            }
-            for r in readings
-        ]).sort_values("timestamp")
-    
-    def _calculate_trend(self, df: pd.DataFrame) -> Tuple[TrendIndicator, Optional[float]]:
+    def _readings_to_arrays(self, readings: List[Reading]) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Calculate short-term trend using moving average comparison.
+        Convert readings to parallel timestamp/level arrays.
         
         Returns:
-            Tuple of (TrendIndicator, magnitude in meters)
-        """
-        if len(df) < 2:
-            return TrendIndicator.INSUFFICIENT_DATA, None
-        
-        # TODO: Implement trend calculation logic
-        # - Compare recent average to earlier average
-        # - Classify as Recharging, Stable, or Depleting
-        # - Calculate magnitude of change
-        
-        return TrendIndicator.INSUFFICIENT_DATA, None
-    
-    def _calculate_seasonal_deviation(
-        self,
-        df: pd.DataFrame,
-        reference_date: datetime
-    ) -> Tuple[Optional[float], Optional[float]]:
+            Tuple of (timestamps as datetime64[us], water levels as float64
+            with NaN for missing values)
         """
-        Calculate deviation from seasonal baseline.
-        
-        Returns:
-            Tuple of (deviation in meters, baseline value)
-        """
-        if len(df) < 30:  # Need at least some historical data
-            return None, None
-        
-        # TODO: Implement seasonal deviation calculation
-        # - Compare current period to same period in previous years
-        # - Calculate deviation from baseline
-        
-        return None, None
+        count = len(readings)
+        timestamps = np.fromiter(
+            (r.timestamp for r in readings), dtype="datetime64[us]", count=count
+        )
+        levels = np.fromiter(
+            (np.nan if r.water_level_m is None else r.water_level_m for r in readings),
+            dtype=np.float64,
+            count=count
+        )
+        return timestamps, levels
     
     def _calculate_risk_index(
         self,
@@ -171,10 +214,11 @@ class ProcessingEngine:
     def _create_empty_metrics(
         self,
         readings: List[Reading],
-        calculation_date: Optional[datetime]
+        calculation_date: Optional[datetime],
+        station_id: Optional[str] = None
     ) -> Metrics:
         """Create empty metrics when insufficient data."""
-        station_id = readings[0].station_id if readings else "unknown"
+        station_id = station_id or (readings[0].station_id if readings else "unknown")
         # calculation_date must be provided explicitly - no system time fallback
         if calculation_date is None:
             raise ValueError("calculation_date must be provided when creating empty metrics")